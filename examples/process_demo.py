@@ -8,9 +8,8 @@ from pathlib import Path
 from mm_clikit import (
     TyperPlus,
     fatal,
-    is_process_running,
+    get_running_pid,
     print_plain,
-    read_pid_file,
     spawn_daemon,
     stop_process,
     write_pid_file,
@@ -25,8 +24,9 @@ app = TyperPlus()
 @app.command()
 def start() -> None:
     """Start the background daemon."""
-    if is_process_running(PID_PATH, command_contains=SCRIPT, remove_stale=True):
-        fatal(f"daemon is already running (pid {read_pid_file(PID_PATH)})")
+    running_pid = get_running_pid(PID_PATH, command_contains=SCRIPT, remove_stale=True)
+    if running_pid is not None:
+        fatal(f"daemon is already running (pid {running_pid})")
     pid = spawn_daemon([sys.executable, __file__, "_daemon"])
     print_plain(f"daemon started (pid {pid})")
 
@@ -34,8 +34,8 @@ def start() -> None:
 @app.command()
 def stop() -> None:
     """Stop the running daemon."""
-    pid = read_pid_file(PID_PATH)
-    if pid is None or not is_process_running(PID_PATH, command_contains=SCRIPT):
+    pid = get_running_pid(PID_PATH, command_contains=SCRIPT)
+    if pid is None:
         fatal("daemon is not running")
     stop_process(pid)
     PID_PATH.unlink(missing_ok=True)
@@ -45,8 +45,8 @@ def stop() -> None:
 @app.command()
 def status() -> None:
     """Show daemon status."""
-    pid = read_pid_file(PID_PATH)
-    if pid is not None and is_process_running(PID_PATH, command_contains=SCRIPT):
+    pid = get_running_pid(PID_PATH, command_contains=SCRIPT)
+    if pid is not None:
         print_plain(f"daemon is running (pid {pid})")
     else:
         print_plain("daemon is not running")
@@ -26,9 +26,11 @@ def main(
     if not path.exists():
         fatal(f"file not found: {path}")
 
-    text = path.read_text()
-    matches = [line for line in text.splitlines() if re.search(pattern, line, flags)]
-    print_plain(f"{len(matches)} lines match '{pattern}'")
+    regex = re.compile(pattern, flags)
+    # Stream line by line so memory stays bounded by the longest line, not the file size
+    with path.open(buffering=1 << 20) as f:
+        count = sum(1 for line in f if regex.search(line.rstrip("\n")))
+    print_plain(f"{count} lines match '{pattern}'")
 
 
 if __name__ == "__main__":
@@ -1,30 +1,129 @@
-"""Shared CLI utilities library."""
-
-from .cli_error import CliError as CliError
-from .config import BaseConfig as BaseConfig
-from .config import BaseDataDirConfig as BaseDataDirConfig
-from .core_context import CoreContext as CoreContext
-from .core_context import use_context as use_context
-from .dual_mode_output import DualModeOutput as DualModeOutput
-from .json_mode import get_json_mode as get_json_mode
-from .logging import setup_logging as setup_logging
-from .output import print_json as print_json
-from .output import print_plain as print_plain
-from .output import print_table as print_table
-from .output import print_toml as print_toml
-from .params import DecimalParam as DecimalParam
-from .process import is_process_running as is_process_running
-from .process import read_pid_file as read_pid_file
-from .process import spawn_daemon as spawn_daemon
-from .process import stop_process as stop_process
-from .process import write_pid_file as write_pid_file
-from .sqlite import Migration as Migration
-from .sqlite import SqliteDb as SqliteDb
-from .sqlite import SqliteRow as SqliteRow
-from .toml_config import TomlConfig as TomlConfig
-from .tui import ModalConfirmScreen as ModalConfirmScreen
-from .tui import ModalInputScreen as ModalInputScreen
-from .tui import ModalListPickerScreen as ModalListPickerScreen
-from .tui import ModalTextAreaScreen as ModalTextAreaScreen
-from .typer_plus import TyperPlus as TyperPlus
-from .utils import fatal as fatal
+"""Shared CLI utilities library.
+
+Public names are resolved lazily (PEP 562) so a CLI only imports the submodules it
+actually uses — e.g. ``print_plain`` does not pull in pydantic, textual, or sqlite.
+Each export is listed three times — the ``TYPE_CHECKING`` imports, ``_LAZY`` and
+``__all__`` — and ``tests/mm_clikit/test_init.py`` checks that the three agree.
+"""
+
+import importlib
+import importlib.util
+from typing import TYPE_CHECKING, Any
+
+# Static re-exports for type checkers only; at runtime names resolve through __getattr__ below
+if TYPE_CHECKING:
+    from .cli_error import CliError as CliError
+    from .config import BaseConfig as BaseConfig
+    from .config import BaseDataDirConfig as BaseDataDirConfig
+    from .core_context import CoreContext as CoreContext
+    from .core_context import use_context as use_context
+    from .dual_mode_output import DualModeOutput as DualModeOutput
+    from .json_mode import get_json_mode as get_json_mode
+    from .logging import setup_logging as setup_logging
+    from .output import print_json as print_json
+    from .output import print_plain as print_plain
+    from .output import print_table as print_table
+    from .output import print_toml as print_toml
+    from .params import DecimalParam as DecimalParam
+    from .process import get_running_pid as get_running_pid
+    from .process import is_process_running as is_process_running
+    from .process import read_pid_file as read_pid_file
+    from .process import spawn_daemon as spawn_daemon
+    from .process import stop_process as stop_process
+    from .process import write_pid_file as write_pid_file
+    from .sqlite import Migration as Migration
+    from .sqlite import SqliteDb as SqliteDb
+    from .sqlite import SqliteRow as SqliteRow
+    from .toml_config import TomlConfig as TomlConfig
+    from .tui import ModalConfirmScreen as ModalConfirmScreen
+    from .tui import ModalInputScreen as ModalInputScreen
+    from .tui import ModalListPickerScreen as ModalListPickerScreen
+    from .tui import ModalTextAreaScreen as ModalTextAreaScreen
+    from .typer_plus import TyperPlus as TyperPlus
+    from .utils import fatal as fatal
+
+# public name -> submodule that defines it
+_LAZY: dict[str, str] = {
+    "CliError": ".cli_error",
+    "BaseConfig": ".config",
+    "BaseDataDirConfig": ".config",
+    "CoreContext": ".core_context",
+    "use_context": ".core_context",
+    "DualModeOutput": ".dual_mode_output",
+    "get_json_mode": ".json_mode",
+    "setup_logging": ".logging",
+    "print_json": ".output",
+    "print_plain": ".output",
+    "print_table": ".output",
+    "print_toml": ".output",
+    "DecimalParam": ".params",
+    "get_running_pid": ".process",
+    "is_process_running": ".process",
+    "read_pid_file": ".process",
+    "spawn_daemon": ".process",
+    "stop_process": ".process",
+    "write_pid_file": ".process",
+    "Migration": ".sqlite",
+    "SqliteDb": ".sqlite",
+    "SqliteRow": ".sqlite",
+    "TomlConfig": ".toml_config",
+    "ModalConfirmScreen": ".tui",
+    "ModalInputScreen": ".tui",
+    "ModalListPickerScreen": ".tui",
+    "ModalTextAreaScreen": ".tui",
+    "TyperPlus": ".typer_plus",
+    "fatal": ".utils",
+}
+
+__all__ = [
+    "BaseConfig",
+    "BaseDataDirConfig",
+    "CliError",
+    "CoreContext",
+    "DecimalParam",
+    "DualModeOutput",
+    "Migration",
+    "ModalConfirmScreen",
+    "ModalInputScreen",
+    "ModalListPickerScreen",
+    "ModalTextAreaScreen",
+    "SqliteDb",
+    "SqliteRow",
+    "TomlConfig",
+    "TyperPlus",
+    "fatal",
+    "get_json_mode",
+    "get_running_pid",
+    "is_process_running",
+    "print_json",
+    "print_plain",
+    "print_table",
+    "print_toml",
+    "read_pid_file",
+    "setup_logging",
+    "spawn_daemon",
+    "stop_process",
+    "use_context",
+    "write_pid_file",
+]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401 — returns whichever object the submodule exports
+    """Import the defining submodule on first access and cache the attribute in module globals.
+
+    Submodule names (e.g. ``mm_clikit.output``) resolve too, importing the submodule on demand.
+    """
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        if importlib.util.find_spec(f"{__name__}.{name}") is None:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        # import_module also binds the submodule as an attribute of this package
+        return importlib.import_module(f".{name}", __name__)
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the public exports plus the module's own dunder attributes."""
+    return sorted([*__all__, *(name for name in globals() if name.startswith("__"))])
@@ -35,4 +35,5 @@ class DualModeOutput:
         if self.json_mode:
             print_json({"ok": True, "data": json_data, "error": None})
         else:
+            # A fresh Console picks up the current stdout, terminal width, and color settings
             Console().print(display_data)
@@ -20,7 +20,12 @@ def print_plain(*messages: object, file: TextIO | None = None) -> None:
         file: Output stream.  Defaults to ``sys.stdout`` when ``None``.
 
     """
-    print(*messages, file=file or sys.stdout)
+    stream = file or sys.stdout
+    if stream is None:
+        # sys.stdout is None under pythonw or a detached daemon; print() silently does nothing there too
+        return
+    # One write per call instead of print()'s separate writes for each value, separator, and newline
+    stream.write(" ".join(map(str, messages)) + "\n")
 
 
 def print_json(data: object, type_handlers: dict[type[Any], Callable[[Any], Any]] | None = None) -> None:
@@ -59,6 +64,6 @@ def print_toml(content: str | Mapping[str, Any], *, line_numbers: bool = False,
     """
     toml_string = tomlkit.dumps(content) if isinstance(content, Mapping) else content
 
-    console = Console()
     syntax = Syntax(toml_string, "toml", theme=theme, line_numbers=line_numbers)
+    console = Console()
     console.print(syntax)
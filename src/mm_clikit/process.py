@@ -7,6 +7,7 @@ if sys.platform == "win32":
 
 import contextlib
 import os
+import select
 import signal
 import subprocess  # nosec B404
 import tempfile
@@ -17,7 +18,13 @@ from pathlib import Path
 def read_pid_file(pid_path: Path) -> int | None:
     """Read PID from file. Returns None if missing, unreadable, or not a positive integer."""
     try:
-        pid = int(pid_path.read_text().strip())
+        # PID files are a few bytes; a raw read skips Path's text decoding layer
+        fd = os.open(pid_path, os.O_RDONLY)
+        try:
+            data = os.read(fd, 32)
+        finally:
+            os.close(fd)
+        pid = int(data)  # int() strips surrounding whitespace itself
     except ValueError, OSError:
         return None
     return pid if pid > 0 else None
@@ -49,38 +56,72 @@ def is_process_running(
 
     Args:
         pid_path: Path to the PID file.
-        command_contains: If set, verify the process command line (via ``ps -o args=``) contains this substring.
+        command_contains: If set, verify the process command line (``/proc/<pid>/cmdline`` on Linux,
+            ``ps -o args=`` elsewhere) contains this substring.
         remove_stale: Remove the PID file if the process is dead.
         skip_self: Return False if the PID matches the current process.
 
+    """
+    pid = get_running_pid(pid_path, command_contains=command_contains, remove_stale=remove_stale, skip_self=skip_self)
+    return pid is not None
+
+
+def get_running_pid(
+    pid_path: Path, *, command_contains: str | None = None, remove_stale: bool = False, skip_self: bool = False
+) -> int | None:
+    """Return the PID recorded in a PID file if that process is alive, else None.
+
+    Same checks and arguments as :func:`is_process_running`; use this when the PID is
+    needed too, so the PID file is read and the process probed only once.
     """
     pid = read_pid_file(pid_path)
     if pid is None:
-        return False
+        return None
 
     if skip_self and pid == os.getpid():
-        return False
+        return None
 
     try:
         os.kill(pid, 0)
     except ProcessLookupError:
         if remove_stale:
             pid_path.unlink(missing_ok=True)
-        return False
+        return None
     except PermissionError:
         # Process exists but owned by another user
-        return True
+        return pid
 
     if command_contains is not None:
+        command_line = _read_command_line(pid)
+        if command_line is None or command_contains not in command_line:
+            return None
+
+    return pid
+
+
+def _read_command_line(pid: int) -> str | None:
+    """Return the space-joined command line of a process, or None if it can't be read.
+
+    Reads ``/proc/<pid>/cmdline`` on Linux; falls back to ``ps -o args=`` elsewhere
+    or when cmdline is empty.
+    """
+    if sys.platform == "linux":
         try:
-            # S603/S607: args are controlled literals, "ps" is a standard system utility
-            result = subprocess.run(["ps", "-p", str(pid), "-o", "args="], capture_output=True, text=True, check=False)  # noqa: S603, S607  # nosec B603, B607
+            with Path(f"/proc/{pid}/cmdline").open("rb") as f:
+                raw = f.read()
         except OSError:
-            return False
-        else:
-            return command_contains in result.stdout
+            return None
+        # Arguments are NUL-separated, with a trailing NUL.  cmdline is empty for zombies,
+        # kernel threads, and processes still mid-exec — let ps report those instead.
+        if raw:
+            return raw.rstrip(b"\0").replace(b"\0", b" ").decode(errors="replace")
 
-    return True
+    try:
+        # S603/S607: args are controlled literals, "ps" is a standard system utility
+        result = subprocess.run(["ps", "-p", str(pid), "-o", "args="], capture_output=True, text=True, check=False)  # noqa: S603, S607  # nosec B603, B607
+    except OSError:
+        return None
+    return result.stdout
 
 
 def stop_process(pid: int, *, timeout: float = 3.0, poll_interval: float = 0.1, force_kill: bool = True) -> bool:
@@ -89,7 +130,7 @@ def stop_process(pid: int, *, timeout: float = 3.0, poll_interval: float = 0.1,
     Args:
         pid: Process ID to stop.
         timeout: Seconds to wait for graceful shutdown.
-        poll_interval: Seconds between liveness polls.
+        poll_interval: Seconds between liveness polls on platforms without pidfd support.
         force_kill: Send SIGKILL if process doesn't exit within timeout.
 
     Returns:
@@ -101,6 +142,39 @@ def stop_process(pid: int, *, timeout: float = 3.0, poll_interval: float = 0.1,
     except ProcessLookupError:
         return True
 
+    if _wait_for_exit(pid, timeout=timeout, poll_interval=poll_interval):
+        return True
+
+    if force_kill:
+        with contextlib.suppress(ProcessLookupError):
+            os.kill(pid, signal.SIGKILL)
+        return True
+
+    return False
+
+
+def _wait_for_exit(pid: int, *, timeout: float, poll_interval: float) -> bool:
+    """Block until the process exits or the timeout elapses. Returns True if it exited.
+
+    On Linux, waits on a pidfd, which becomes readable the moment the process
+    terminates — no wakeups while it is still running. Elsewhere (or when the kernel
+    lacks pidfd support), polls ``os.kill(pid, 0)`` every ``poll_interval`` seconds.
+    """
+    if sys.platform == "linux":
+        try:
+            pidfd = os.pidfd_open(pid)
+        except ProcessLookupError:
+            return True
+        except OSError:
+            pass  # e.g. ENOSYS on pre-5.3 kernels — fall back to polling
+        else:
+            try:
+                poller = select.poll()
+                poller.register(pidfd, select.POLLIN)
+                return bool(poller.poll(max(timeout, 0) * 1000))
+            finally:
+                os.close(pidfd)
+
     deadline = time.monotonic() + timeout
     while time.monotonic() < deadline:
         try:
@@ -108,12 +182,6 @@ def stop_process(pid: int, *, timeout: float = 3.0, poll_interval: float = 0.1,
         except ProcessLookupError:
             return True
         time.sleep(poll_interval)
-
-    if force_kill:
-        with contextlib.suppress(ProcessLookupError):
-            os.kill(pid, signal.SIGKILL)
-        return True
-
     return False
 
 
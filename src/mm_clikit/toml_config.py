@@ -31,9 +31,8 @@ class TomlConfig(BaseModel):
                     pwd = password.encode() if password else None
                     data = tomllib.loads(zf.read(names[0], pwd=pwd).decode())
             else:
-                with expanded.open("rb") as f:
-                    data = tomllib.load(f)
-            return Result.ok(cls(**data))
+                data = tomllib.loads(expanded.read_bytes().decode())
+            return Result.ok(cls.model_validate(data))
         except ValidationError as e:
             return Result.err(("validation_error", e), context={"errors": e.errors()})
         except Exception as e:
@@ -23,6 +23,7 @@ class AliasGroup(TyperGroup):
     _hide_meta_options: ClassVar[bool] = False
     _json_option: ClassVar[bool] = False
     _package_name: ClassVar[str | None] = None
+    _version: ClassVar[str | None] = None
 
     def __init__(
         self,
@@ -36,7 +37,7 @@ class AliasGroup(TyperGroup):
 
         # Append --version when package_name is set (multi-command / group mode)
         if self._package_name and not _has_version_option(self.params):
-            self.params.append(_make_version_option(self._package_name))
+            self.params.append(_make_version_option(self._package_name, self._version))
 
         # Append --json when json_option is enabled
         if self._json_option:
@@ -70,31 +71,34 @@ class AliasGroup(TyperGroup):
                 ),
             )
 
-        # alias -> canonical name
-        self._alias_to_cmd: dict[str, str] = {}
+        # Meta options hidden from normal help; classified on first render because Typer
+        # appends the completion options after the group is constructed
+        self._meta_params: list[click.Option] | None = None
+
         # canonical name -> [aliases]
         self._cmd_aliases: dict[str, list[str]] = {}
 
         # Command-level aliases (set via @app.command(aliases=[...]))
-        for cmd_name, cmd in list(self.commands.items()):
-            callback = getattr(cmd, "callback", None)
-            aliases: list[str] = getattr(callback, _ALIASES_ATTR, [])
-            if not aliases:
-                continue
-            self._cmd_aliases[cmd_name] = list(aliases)
-            for alias in aliases:
-                self._alias_to_cmd[alias] = cmd_name
-                self.commands[alias] = cmd
+        for cmd_name, cmd in self.commands.items():
+            aliases: list[str] = getattr(getattr(cmd, "callback", None), _ALIASES_ATTR, [])
+            if aliases:
+                self._cmd_aliases[cmd_name] = list(aliases)
 
         # Group-level aliases (set via app.add_typer(aliases=[...]))
         group_aliases: dict[str, list[str]] = getattr(type(self), "_bound_group_aliases", {})
         for cmd_name, g_aliases in group_aliases.items():
-            if cmd_name not in self.commands:
-                continue
-            self._cmd_aliases[cmd_name] = list(g_aliases)
-            for alias in g_aliases:
-                self._alias_to_cmd[alias] = cmd_name
-                self.commands[alias] = self.commands[cmd_name]
+            if cmd_name in self.commands:
+                self._cmd_aliases[cmd_name] = list(g_aliases)
+
+        # alias -> canonical name; aliases are resolved in get_command() and never stored in self.commands
+        self._alias_to_cmd: dict[str, str] = {
+            alias: cmd_name for cmd_name, aliases in self._cmd_aliases.items() for alias in aliases
+        }
+
+        # canonical name -> help display name, e.g. "deploy (d)"; built once, reused on every help render
+        self._display_names: dict[str, str] = {
+            cmd_name: f"{cmd_name} ({', '.join(aliases)})" for cmd_name, aliases in self._cmd_aliases.items()
+        }
 
     def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
         """Resolve alias to canonical command before lookup."""
@@ -102,42 +106,50 @@ class AliasGroup(TyperGroup):
         return super().get_command(ctx, cmd_name)
 
     def list_commands(self, ctx: click.Context) -> list[str]:  # noqa: ARG002 — required by Click interface
-        """Return canonical command names only, excluding aliases."""
-        return [name for name in self.commands if name not in self._alias_to_cmd]
+        """Return canonical command names only; aliases are not stored in ``self.commands``."""
+        return list(self.commands)
 
     def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
-        """Temporarily patch command names to include aliases for help display."""
-        originals: dict[str, str] = {}
-        for cmd_name, aliases in self._cmd_aliases.items():
+        """Temporarily patch command names to include aliases for help display.
+
+        Typer's Rich formatter reads ``command.name`` directly, so the precomputed
+        display names are swapped in for the duration of the render.
+        """
+        hide_meta = self._hide_meta_options and not self._show_full_help
+        # Nothing to patch — render directly
+        if not self._display_names and not hide_meta:
+            super().format_help(ctx, formatter)
+            return
+
+        # Patched objects are kept directly so the restore pass needs no lookups
+        renamed: list[tuple[click.Command, str]] = []
+        for cmd_name, display_name in self._display_names.items():
             cmd = self.commands.get(cmd_name)
             if cmd and cmd.name:
-                originals[cmd_name] = cmd.name
-                alias_str = ", ".join(aliases)
-                cmd.name = f"{cmd.name} ({alias_str})"
-
-        # Temporarily hide meta options in normal help
-        hidden_originals: list[tuple[click.Option, bool]] = []
-        if self._hide_meta_options and not self._show_full_help:
-            for param in self.params:
-                if isinstance(param, click.Option) and _is_meta_option(param) and not param.hidden:
-                    hidden_originals.append((param, param.hidden))
-                    param.hidden = True
+                renamed.append((cmd, cmd.name))
+                cmd.name = display_name
+
+        # Temporarily hide meta options in normal help; only visible ones are touched, so all restore to visible
+        hidden: list[click.Option] = []
+        if hide_meta:
+            if self._meta_params is None:
+                self._meta_params = [p for p in self.params if isinstance(p, click.Option) and _is_meta_option(p)]
             # --help is stored separately by Click (not in self.params);
             # use get_help_option() to force-create it if not cached yet
             help_opt = self.get_help_option(ctx)
-            if help_opt is not None and not help_opt.hidden:
-                hidden_originals.append((help_opt, help_opt.hidden))
-                help_opt.hidden = True
+            to_hide = self._meta_params if help_opt is None else [*self._meta_params, help_opt]
+            for opt in to_hide:
+                if not opt.hidden:
+                    hidden.append(opt)
+                    opt.hidden = True
 
         try:
             super().format_help(ctx, formatter)
         finally:
-            for cmd_name, original_name in originals.items():
-                cmd = self.commands.get(cmd_name)
-                if cmd:
-                    cmd.name = original_name
-            for opt, was_hidden in hidden_originals:
-                opt.hidden = was_hidden
+            for cmd, original_name in renamed:
+                cmd.name = original_name
+            for opt in hidden:
+                opt.hidden = False
 
     def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
         """Non-Rich fallback: show aliases in parentheses next to command names."""
@@ -147,11 +159,7 @@ class AliasGroup(TyperGroup):
             if cmd is None or cmd.hidden:
                 continue
             help_text = cmd.get_short_help_str(limit=formatter.width)
-            display_name = cmd_name
-            if cmd_name in self._cmd_aliases:
-                alias_str = ", ".join(self._cmd_aliases[cmd_name])
-                display_name = f"{cmd_name} ({alias_str})"
-            rows.append((display_name, help_text))
+            rows.append((self._display_names.get(cmd_name, cmd_name), help_text))
 
         if rows:
             with formatter.section("Commands"):
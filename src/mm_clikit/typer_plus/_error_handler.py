@@ -9,7 +9,6 @@ from mm_std import json_dumps
 
 from mm_clikit.cli_error import CliError
 from mm_clikit.json_mode import get_json_mode
-from mm_clikit.output import print_plain
 
 ErrorHandler = Callable[[CliError], NoReturn]
 
@@ -23,6 +22,9 @@ def _default_error_handler(error: CliError) -> NoReturn:
     "error": null}``; this error path emits ``{"ok": false, "data": null,
     "error": {"code": ..., "message": ...}}``.
     """
+    # Deferred: mm_clikit.output pulls in rich and tomlkit, only needed once a command fails
+    from mm_clikit.output import print_plain  # noqa: PLC0415
+
     if get_json_mode():
         envelope = {"ok": False, "data": None, "error": {"code": error.code, "message": str(error)}}
         print_plain(json_dumps(envelope))
@@ -1,14 +1,14 @@
 """Click option factories and meta-option helpers for TyperPlus."""
 
-import importlib.metadata
+import functools
 from collections.abc import Callable
 from typing import Any
 
 import click
 import typer
 from typer.core import TyperCommand
-
-from mm_clikit.output import print_plain
+from typer.models import ArgumentInfo, OptionInfo
+from typer.utils import get_params_from_function
 
 # Option strings considered "meta" — always present, rarely useful in help
 _META_OPTION_STRINGS = frozenset({"--help", "--help-all", "--version", "-V", "--install-completion", "--show-completion"})
@@ -18,34 +18,78 @@ def _is_meta_option(param: click.Parameter) -> bool:
     """Check whether a Click parameter is a meta option (help, version, completion)."""
     if not isinstance(param, click.Option):
         return False
-    return bool((set(param.opts) | set(param.secondary_opts)) & _META_OPTION_STRINGS)
+    # isdisjoint() stops at the first hit and builds no intermediate sets
+    return not (_META_OPTION_STRINGS.isdisjoint(param.opts) and _META_OPTION_STRINGS.isdisjoint(param.secondary_opts))
 
 
 def _has_version_option(params: list[click.Parameter]) -> bool:
     """Check if --version already exists in a list of Click parameters."""
-    return any(isinstance(p, click.Option) and "--version" in p.opts for p in params)
+    # Arguments carry their bare name in opts, so "--version" can only match an Option
+    return any("--version" in p.opts for p in params)
 
 
-def create_version_callback(package_name: str) -> Callable[[bool], None]:
+def create_version_callback(package_name: str, version: str | None = None) -> Callable[[bool], None]:
     """Create a --version flag callback for a Typer CLI app.
 
     Args:
         package_name: The installed package name to look up the version for.
+        version: Version string to print as-is.  When ``None``, it is looked up
+            from the installed package metadata.
 
     """
 
     def version_callback(value: bool) -> None:
         """Print the version and exit when --version is passed."""
         if value:
-            print_plain(f"{package_name}: {importlib.metadata.version(package_name)}")
+            # Deferred: mm_clikit.output pulls in rich and tomlkit, only needed once --version is passed
+            from mm_clikit.output import print_plain  # noqa: PLC0415
+
+            print_plain(_format_version(package_name, version))
             raise typer.Exit
 
     return version_callback
 
 
-def _make_version_option(package_name: str) -> click.Option:
+@functools.cache
+def _format_version(package_name: str, version: str | None = None) -> str:
+    """Return the ``{package_name}: {version}`` line printed by ``--version``, built once per process."""
+    return f"{package_name}: {version if version is not None else _installed_version(package_name)}"
+
+
+def _installed_version(package_name: str) -> str:
+    """Look up an installed package's version (scans sys.path, so callers should cache)."""
+    # Deferred: importlib.metadata is only needed when --version is passed without a known version
+    import importlib.metadata  # noqa: PLC0415
+
+    return importlib.metadata.version(package_name)
+
+
+def _defines_version_option(callback: Callable[..., Any]) -> bool:
+    """Check whether a Typer callback declares its own ``--version`` or ``-V`` option.
+
+    Parameters are resolved the way Typer resolves them, so ``Annotated`` metadata and
+    string annotations are honoured, and an undeclared parameter named ``version`` counts
+    as the ``--version`` option Typer derives from its name.
+    """
+    for name, param in get_params_from_function(callback).items():
+        info = param.default
+        if info is param.empty or isinstance(info, ArgumentInfo):
+            # Typer turns a parameter without a default into a positional argument
+            continue
+        decls = info.param_decls if isinstance(info, OptionInfo) else None
+        if not decls:
+            if name == "version":
+                return True
+            continue
+        # A declaration may pair a flag with its negation, e.g. "--version/--no-version"
+        if any(opt.strip() in {"--version", "-V"} for decl in decls for opt in decl.split("/")):
+            return True
+    return False
+
+
+def _make_version_option(package_name: str, version: str | None = None) -> click.Option:
     """Create a ``--version``/``-V`` Click Option with ``expose_value=False``."""
-    version_cb = create_version_callback(package_name)
+    version_cb = create_version_callback(package_name, version)
 
     def callback(_ctx: click.Context, _param: click.Parameter, value: bool) -> None:
         """Delegate to the version callback."""
@@ -71,8 +115,9 @@ def _make_json_option() -> click.Option:
     return click.Option(["--json"], is_flag=True, expose_value=False, callback=callback, help="Output as JSON.")
 
 
-def _make_enhanced_command_cls(package_name: str | None, json_option: bool) -> type[TyperCommand]:
-    """Create a TyperCommand subclass that appends ``--version`` and/or ``--json``."""
+@functools.cache
+def _make_enhanced_command_cls(package_name: str | None, json_option: bool, version: str | None = None) -> type[TyperCommand]:
+    """Return the TyperCommand subclass that appends ``--version`` and/or ``--json``, shared per option combination."""
 
     class EnhancedCommand(TyperCommand):
         """TyperCommand that auto-appends --version and --json to params."""
@@ -80,7 +125,7 @@ def _make_enhanced_command_cls(package_name: str | None, json_option: bool) -> t
         def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
             super().__init__(*args, **kwargs)
             if package_name and not _has_version_option(self.params):
-                self.params.append(_make_version_option(package_name))
+                self.params.append(_make_version_option(package_name, version))
             if json_option:
                 self.params.append(_make_json_option())
 
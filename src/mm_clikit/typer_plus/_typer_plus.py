@@ -2,6 +2,7 @@
 
 import functools
 import inspect
+import sys
 from collections.abc import Callable
 from typing import Any
 
@@ -12,7 +13,24 @@ from mm_clikit.cli_error import CliError
 
 from ._alias_group import _ALIASES_ATTR, AliasGroup
 from ._error_handler import ErrorHandler, _default_error_handler
-from ._options import _make_enhanced_command_cls
+from ._options import _defines_version_option, _format_version, _make_enhanced_command_cls
+
+
+@functools.cache
+def _make_alias_group_cls(
+    hide_meta_options: bool, json_option: bool, package_name: str | None, version: str | None
+) -> type[AliasGroup]:
+    """Return the AliasGroup subclass for an option combination, shared by every TyperPlus using it."""
+    return type(
+        "BoundAliasGroup",
+        (AliasGroup,),
+        {
+            "_hide_meta_options": hide_meta_options,
+            "_json_option": json_option,
+            "_package_name": package_name,
+            "_version": version,
+        },
+    )
 
 
 class TyperPlus(Typer):
@@ -24,6 +42,10 @@ class TyperPlus(Typer):
             persists even when a custom ``@app.callback()`` is registered.
             Defining a ``--version`` option in your callback skips
             auto-injection.
+        version: Version string printed by ``--version``.  Pass a build-time
+            constant (e.g. ``__version__``) to skip the ``importlib.metadata``
+            lookup; when ``None``, the version of ``package_name`` is read from
+            the installed package metadata.
         hide_meta_options: Hide meta options (--help, --version, --install-completion,
             --show-completion) from normal help output.  Adds ``--help-all`` to show
             the full unfiltered help.  Defaults to ``True``.
@@ -40,6 +62,7 @@ class TyperPlus(Typer):
         self,
         *,
         package_name: str | None = None,
+        version: str | None = None,
         hide_meta_options: bool = True,
         json_option: bool = True,
         error_handler: ErrorHandler | None = _default_error_handler,
@@ -49,29 +72,56 @@ class TyperPlus(Typer):
         # Init before super().__init__() — Typer's init writes self.registered_callback = None
         self._registered_callback: TyperInfo | None = None
         self._package_name = package_name
+        self._version = version
         self._json_option = json_option
         self._error_handler = error_handler
 
-        # Mutable dict shared with the dynamic subclass; populated by add_typer()
+        # Single command whose cls was already set up; later registered_callback reads skip the work
+        self._enhanced_cmd_info: CommandInfo | None = None
+
+        # Populated by add_typer(); bound to a per-app AliasGroup subclass on first use
         self._group_aliases: dict[str, list[str]] = {}
+        # Shared AliasGroup subclass for this option combination; None when the caller passed their own cls
+        self._alias_group_cls: type[AliasGroup] | None = None
 
         if "cls" not in kwargs:
-            group_aliases = self._group_aliases
-            kwargs["cls"] = type(
-                "BoundAliasGroup",
-                (AliasGroup,),
-                {
-                    "_bound_group_aliases": group_aliases,
-                    "_hide_meta_options": hide_meta_options,
-                    "_json_option": json_option,
-                    "_package_name": package_name,
-                },
-            )
+            self._alias_group_cls = _make_alias_group_cls(hide_meta_options, json_option, package_name, version)
+            kwargs["cls"] = self._alias_group_cls
 
         kwargs.setdefault("no_args_is_help", True)
         kwargs.setdefault("pretty_exceptions_enable", False)
         super().__init__(**kwargs)
 
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401 — mirrors Typer.__call__
+        """Run the app, answering a bare ``--version`` / ``-V`` before the Click command tree is built.
+
+        Skipped when a custom ``cls`` is passed, since that group gets no injected ``--version``.
+        """
+        package_name = self._package_name
+        if (
+            package_name
+            and self._alias_group_cls is not None
+            and not args
+            and not kwargs
+            and sys.argv[1:] in (["--version"], ["-V"])
+            and not self._has_user_version_option()
+        ):
+            # Deferred: mm_clikit.output pulls in rich and tomlkit, only needed on this path
+            from mm_clikit.output import print_plain  # noqa: PLC0415
+
+            print_plain(_format_version(package_name, self._version))
+            raise SystemExit(0)
+        return super().__call__(*args, **kwargs)
+
+    def _has_user_version_option(self) -> bool:
+        """Check whether a user callback declares its own top-level ``--version``."""
+        callbacks = [self.info.callback, self._registered_callback.callback if self._registered_callback else None]
+        if not self.registered_groups and len(self.registered_commands) == 1:
+            # Single-command mode: the command's own options sit at the top level
+            callbacks.append(self.registered_commands[0].callback)
+        # info.callback is a DefaultPlaceholder when Typer(callback=...) was not passed
+        return any(callable(cb) and _defines_version_option(cb) for cb in callbacks)
+
     @property
     def registered_callback(self) -> TyperInfo | None:
         """Lazy property that sets up single-command version injection on first read.
@@ -95,10 +145,11 @@ class TyperPlus(Typer):
         if len(self.registered_commands) != 1 or self.registered_groups:
             return
         cmd_info = self.registered_commands[0]
-        if cmd_info.callback is None:
+        if cmd_info.callback is None or cmd_info is self._enhanced_cmd_info:
             return
 
-        cmd_info.cls = _make_enhanced_command_cls(self._package_name, self._json_option)
+        self._enhanced_cmd_info = cmd_info
+        cmd_info.cls = _make_enhanced_command_cls(self._package_name, self._json_option, self._version)
         self._propagate_no_args_is_help(cmd_info)
 
     def _propagate_no_args_is_help(self, cmd_info: CommandInfo) -> None:
@@ -127,6 +178,9 @@ class TyperPlus(Typer):
                 name = name.value
             if name is None:
                 raise ValueError("Cannot set aliases without a name. Provide name= in add_typer().")
+            if not self._group_aliases and self._alias_group_cls is not None:
+                # Group aliases are per-app state, so this app now needs its own subclass
+                self.info.cls = type("BoundAliasGroup", (self._alias_group_cls,), {"_bound_group_aliases": self._group_aliases})
             self._group_aliases[name] = list(aliases)
 
     def command(
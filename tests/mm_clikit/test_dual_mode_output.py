@@ -5,6 +5,7 @@ import json
 import click
 import pytest
 from rich.table import Table
+from rich.text import Text
 
 from mm_clikit import DualModeOutput
 
@@ -56,6 +57,18 @@ class TestOutput:
         assert "Name" in captured
         assert "test" in captured
 
+    def test_display_follows_current_color_settings(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Color settings are read on every call, so no escapes leak once color is off."""
+        out = DualModeOutput()
+        monkeypatch.setenv("FORCE_COLOR", "1")
+        out.output(json_data={}, display_data=Text("styled", style="bold"))
+        assert "\x1b[" in capsys.readouterr().out
+        monkeypatch.delenv("FORCE_COLOR")
+        out.output(json_data={}, display_data=Text("styled", style="bold"))
+        assert capsys.readouterr().out == "styled\n"
+
     def test_json_mode_ignores_rich_renderable(self, capsys: pytest.CaptureFixture[str]) -> None:
         """JSON mode outputs JSON even when display_data is a Rich renderable."""
         ctx = click.Context(click.Command("test"))
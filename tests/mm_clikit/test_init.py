@@ -0,0 +1,54 @@
+"""Tests for the lazy package exports."""
+
+import ast
+import inspect
+
+import pytest
+
+import mm_clikit
+
+
+def _type_checking_imports() -> dict[str, str]:
+    """Map each name re-exported under ``if TYPE_CHECKING:`` to its relative submodule."""
+    tree = ast.parse(inspect.getsource(mm_clikit))
+    block = next(
+        node
+        for node in tree.body
+        if isinstance(node, ast.If) and isinstance(node.test, ast.Name) and node.test.id == "TYPE_CHECKING"
+    )
+    return {
+        alias.asname or alias.name: "." * node.level + (node.module or "")
+        for node in block.body
+        if isinstance(node, ast.ImportFrom)
+        for alias in node.names
+    }
+
+
+class TestExports:
+    """Tests for the hand-maintained export lists."""
+
+    def test_lists_agree(self) -> None:
+        """TYPE_CHECKING imports, _LAZY, and __all__ name the same exports from the same submodules."""
+        assert _type_checking_imports() == mm_clikit._LAZY  # noqa: SLF001
+        assert sorted(mm_clikit.__all__) == sorted(mm_clikit._LAZY)  # noqa: SLF001
+
+    @pytest.mark.parametrize("name", mm_clikit.__all__)
+    def test_export_resolves(self, name: str) -> None:
+        """Every exported name resolves through the lazy __getattr__."""
+        assert getattr(mm_clikit, name) is not None
+
+    def test_dir_hides_helpers(self) -> None:
+        """dir() shows the exports but not helper imports."""
+        names = dir(mm_clikit)
+        assert set(mm_clikit.__all__) <= set(names)
+        assert "importlib" not in names
+        assert "TYPE_CHECKING" not in names
+
+    def test_submodule_attribute(self) -> None:
+        """Submodules are reachable as attributes without an explicit import."""
+        assert mm_clikit.output.print_plain is mm_clikit.print_plain
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Unknown names raise AttributeError."""
+        with pytest.raises(AttributeError, match="no_such_name"):
+            _ = mm_clikit.no_such_name  # type: ignore[attr-defined]
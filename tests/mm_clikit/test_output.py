@@ -35,6 +35,11 @@ class TestPrintPlain:
         mm_clikit.print_plain(value)
         assert capsys.readouterr().out == expected
 
+    def test_no_stdout(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Does nothing when sys.stdout is None, like print()."""
+        monkeypatch.setattr("sys.stdout", None)
+        mm_clikit.print_plain("hello")
+
 
 class TestPrintJson:
     """Tests for print_json function."""
@@ -132,6 +137,15 @@ class TestPrintTable:
         assert "—" not in output
         assert "None" not in output
 
+    def test_follows_current_color_settings(self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+        """Color settings are read on every call, so no escapes leak once color is off."""
+        monkeypatch.setenv("FORCE_COLOR", "1")
+        mm_clikit.print_table(["Val"], [["a"]])
+        assert "\x1b[" in capsys.readouterr().out
+        monkeypatch.delenv("FORCE_COLOR")
+        mm_clikit.print_table(["Val"], [["a"]])
+        assert "\x1b[" not in capsys.readouterr().out
+
 
 class TestPrintToml:
     """Tests for print_toml function."""
@@ -4,20 +4,37 @@ import contextlib
 import os
 import signal
 import subprocess
+import sys
 import time
 from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
 
-from mm_clikit.process import is_process_running, read_pid_file, spawn_daemon, stop_process, write_pid_file
+from mm_clikit.process import (
+    get_running_pid,
+    is_process_running,
+    read_pid_file,
+    spawn_daemon,
+    stop_process,
+    write_pid_file,
+)
+
+# PID of the test process itself, compared against what the code under test writes and reads
+_SELF_PID = os.getpid()
+
+# posix_spawn file actions pointing stdin/stdout/stderr at /dev/null
+_DEVNULL_STDIO = [(os.POSIX_SPAWN_OPEN, fd, os.devnull, os.O_RDWR, 0) for fd in (0, 1, 2)]
+
+# argv[0] of the beacon fixture's process, matched by command_contains tests
+_BEACON_TOKEN = "mm_clikit_beacon"
 
 
 def _dead_pid() -> int:
     """Return a PID guaranteed to be dead."""
-    proc = subprocess.Popen(["true"])
-    proc.wait()
-    return proc.pid
+    pid = os.posix_spawnp("true", ["true"], os.environ)
+    os.waitpid(pid, 0)
+    return pid
 
 
 def _spawn_orphan(cmd: str) -> int:
@@ -25,7 +42,8 @@ def _spawn_orphan(cmd: str) -> int:
 
     Backgrounds ``cmd`` in a shell and returns its PID.  The intermediate
     shell exits immediately so the spawned process is reparented to init,
-    avoiding zombie issues in tests.
+    avoiding zombie issues in tests.  No Python runs in a forked child, which
+    keeps this safe inside multi-threaded pytest-xdist workers.
     """
     result = subprocess.run(
         ["sh", "-c", f"{cmd} </dev/null >/dev/null 2>&1 & echo $!"],
@@ -49,33 +67,54 @@ def pid_file(tmp_path: Path) -> Path:
 def spawned_sleeper(tmp_path: Path) -> Iterator[tuple[int, Path]]:
     """Spawn a sleep process, write its PID to a file, kill on teardown."""
     pid_path = tmp_path / "sleeper.pid"
+    pid = os.posix_spawnp("sleep", ["sleep", "60"], os.environ, file_actions=_DEVNULL_STDIO, setsid=True)
+    pid_path.write_text(f"{pid}\n")
+    yield pid, pid_path
+    # The test may already have killed or reaped the sleeper (e.g. via stop_process)
+    with contextlib.suppress(ProcessLookupError, ChildProcessError):
+        os.kill(pid, signal.SIGKILL)
+        os.waitpid(pid, 0)
+
+
+@pytest.fixture(scope="session")
+def beacon(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    """Spawn one long-lived ``cat`` whose argv[0] is a unique token; yield its PID file.
+
+    Shared by the read-only command-line matching tests.  ``cat`` blocks on the open
+    stdin pipe and exits as soon as teardown closes it.
+    """
+    pid_path = tmp_path_factory.mktemp("beacon") / "beacon.pid"
     proc = subprocess.Popen(
-        ["sleep", "60"],
-        start_new_session=True,
+        [_BEACON_TOKEN],
+        executable="cat",
+        stdin=subprocess.PIPE,
         stdout=subprocess.DEVNULL,
         stderr=subprocess.DEVNULL,
-        stdin=subprocess.DEVNULL,
     )
     pid_path.write_text(f"{proc.pid}\n")
-    yield proc.pid, pid_path
-    with contextlib.suppress(ProcessLookupError):
-        os.kill(proc.pid, signal.SIGKILL)
-    with contextlib.suppress(ChildProcessError):
-        os.waitpid(proc.pid, os.WNOHANG)
+    yield pid_path
+    assert proc.stdin is not None
+    proc.stdin.close()
+    proc.wait()
 
 
 @pytest.fixture()
 def stubborn_process() -> Iterator[int]:
-    """Spawn a child process that ignores SIGTERM."""
+    """Spawn a child process that ignores SIGTERM.
+
+    The shell ignores TERM and then execs ``sleep``; an ignored disposition survives exec.
+    """
     proc = subprocess.Popen(
-        ["python3", "-c", "import signal, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); time.sleep(60)"],
+        ["sh", "-c", 'trap "" TERM; echo ready; exec sleep 60'],
         start_new_session=True,
-        stdout=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
         stderr=subprocess.DEVNULL,
         stdin=subprocess.DEVNULL,
     )
-    # Wait for signal handler to be installed
-    time.sleep(0.2)
+    # Block until the trap is installed
+    assert proc.stdout is not None
+    proc.stdout.readline()
+    proc.stdout.close()
     yield proc.pid
     proc.kill()
     proc.wait()
@@ -83,14 +122,15 @@ def stubborn_process() -> Iterator[int]:
 
 @pytest.fixture()
 def spawned_pids() -> Iterator[list[int]]:
-    """Collector for PIDs that need cleanup after the test."""
+    """Collector for PIDs that need cleanup after the test.
+
+    The PIDs are double-forked daemons adopted by init, so they are killed but never reaped here.
+    """
     pids: list[int] = []
     yield pids
     for pid in pids:
         with contextlib.suppress(ProcessLookupError):
             os.kill(pid, signal.SIGKILL)
-        with contextlib.suppress(ChildProcessError):
-            os.waitpid(pid, os.WNOHANG)
 
 
 # -- Tests --
@@ -128,25 +168,25 @@ class TestWritePidFile:
     def test_writes_current_pid(self, pid_file: Path) -> None:
         """File contains the current process PID."""
         write_pid_file(pid_file)
-        assert int(pid_file.read_text().strip()) == os.getpid()
+        assert int(pid_file.read_text().strip()) == _SELF_PID
 
     def test_creates_parent_dirs(self, tmp_path: Path) -> None:
         """Creates parent directories if they don't exist."""
         nested = tmp_path / "a" / "b" / "c" / "test.pid"
         write_pid_file(nested)
         assert nested.exists()
-        assert int(nested.read_text().strip()) == os.getpid()
+        assert int(nested.read_text().strip()) == _SELF_PID
 
     def test_overwrites_existing(self, pid_file: Path) -> None:
         """Overwrites an existing PID file."""
         pid_file.write_text("99999\n")
         write_pid_file(pid_file)
-        assert int(pid_file.read_text().strip()) == os.getpid()
+        assert int(pid_file.read_text().strip()) == _SELF_PID
 
     def test_roundtrip_with_read(self, pid_file: Path) -> None:
         """write_pid_file followed by read_pid_file returns current PID."""
         write_pid_file(pid_file)
-        assert read_pid_file(pid_file) == os.getpid()
+        assert read_pid_file(pid_file) == _SELF_PID
 
 
 class TestIsProcessRunning:
@@ -191,24 +231,37 @@ class TestIsProcessRunning:
 
     def test_skip_self(self, pid_file: Path) -> None:
         """Returns False when PID matches current process and skip_self=True."""
-        pid_file.write_text(f"{os.getpid()}\n")
+        pid_file.write_text(f"{_SELF_PID}\n")
         assert is_process_running(pid_file, skip_self=True) is False
 
     def test_no_skip_self(self, pid_file: Path) -> None:
         """Returns True when PID matches current process (default)."""
-        pid_file.write_text(f"{os.getpid()}\n")
+        pid_file.write_text(f"{_SELF_PID}\n")
         assert is_process_running(pid_file) is True
 
-    def test_command_contains_match(self, spawned_sleeper: tuple[int, Path]) -> None:
+    def test_command_contains_match(self, beacon: Path) -> None:
         """Returns True when command line contains the expected substring."""
-        _, pid_path = spawned_sleeper
-        assert is_process_running(pid_path, command_contains="sleep") is True
+        assert is_process_running(beacon, command_contains=_BEACON_TOKEN) is True
 
-    def test_command_contains_no_match(self, spawned_sleeper: tuple[int, Path]) -> None:
+    def test_command_contains_no_match(self, beacon: Path) -> None:
         """Returns False when command line doesn't contain the substring."""
-        _, pid_path = spawned_sleeper
+        assert is_process_running(beacon, command_contains="nonexistent-cmd-xyz") is False
+
+    def test_command_contains_zombie(self, spawned_sleeper: tuple[int, Path]) -> None:
+        """Matches an unreaped zombie, whose empty /proc cmdline falls back to ps."""
+        pid, pid_path = spawned_sleeper
+        os.kill(pid, signal.SIGTERM)
+        # WNOWAIT blocks until the sleeper is dead but leaves it unreaped, i.e. a zombie
+        os.waitid(os.P_PID, pid, os.WEXITED | os.WNOWAIT)
+        assert is_process_running(pid_path, command_contains="sleep") is True
         assert is_process_running(pid_path, command_contains="nonexistent-cmd-xyz") is False
 
+    def test_command_contains_via_ps(self, beacon: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Off Linux the command line comes from ps."""
+        monkeypatch.setattr(sys, "platform", "darwin")
+        assert is_process_running(beacon, command_contains=_BEACON_TOKEN) is True
+        assert is_process_running(beacon, command_contains="nonexistent-cmd-xyz") is False
+
     @pytest.mark.skipif(os.getuid() == 0, reason="test requires non-root user")
     def test_permission_error_returns_true(self, pid_file: Path) -> None:
         """Returns True when process exists but is owned by another user (PID 1)."""
@@ -216,6 +269,25 @@ class TestIsProcessRunning:
         assert is_process_running(pid_file) is True
 
 
+class TestGetRunningPid:
+    """Tests for get_running_pid."""
+
+    def test_running_process(self, spawned_sleeper: tuple[int, Path]) -> None:
+        """Returns the PID of a live process."""
+        pid, pid_path = spawned_sleeper
+        assert get_running_pid(pid_path) == pid
+
+    def test_dead_process(self, pid_file: Path) -> None:
+        """Returns None for a dead PID and removes the file with remove_stale=True."""
+        pid_file.write_text(f"{_dead_pid()}\n")
+        assert get_running_pid(pid_file, remove_stale=True) is None
+        assert not pid_file.exists()
+
+    def test_command_contains_no_match(self, beacon: Path) -> None:
+        """Returns None when the command line doesn't contain the substring."""
+        assert get_running_pid(beacon, command_contains="nonexistent-cmd-xyz") is None
+
+
 class TestStopProcess:
     """Tests for stop_process."""
 
@@ -253,6 +325,16 @@ class TestStopProcess:
         assert result is True
         assert elapsed < 2.0
 
+    @pytest.mark.skipif(sys.platform != "linux", reason="pidfd wait is Linux-only")
+    def test_unreaped_child_returns_early(self, spawned_sleeper: tuple[int, Path]) -> None:
+        """Returns as soon as an own, not-yet-reaped child exits (pidfd sees the zombie as exited)."""
+        pid, _ = spawned_sleeper
+        start = time.monotonic()
+        result = stop_process(pid, timeout=5.0, force_kill=False)
+        elapsed = time.monotonic() - start
+        assert result is True
+        assert elapsed < 2.0
+
 
 class TestSpawnDaemon:
     """Tests for spawn_daemon."""
@@ -273,7 +355,7 @@ class TestSpawnDaemon:
         """Spawned process runs in a new session."""
         pid = spawn_daemon(["sleep", "60"])
         spawned_pids.append(pid)
-        assert os.getsid(pid) != os.getsid(os.getpid())
+        assert os.getsid(pid) != os.getsid(_SELF_PID)
 
     def test_invalid_command_raises(self) -> None:
         """Raises FileNotFoundError for a nonexistent command."""
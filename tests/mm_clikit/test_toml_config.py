@@ -17,14 +17,20 @@ class SampleConfig(TomlConfig):
     port: int
 
 
+@pytest.fixture(scope="module")
+def valid_config_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write a valid SampleConfig TOML file once for the read-only tests to share."""
+    path = tmp_path_factory.mktemp("toml_config") / "config.toml"
+    path.write_text('host = "localhost"\nport = 8080\n')
+    return path
+
+
 class TestLoad:
     """Tests for TomlConfig.load class method."""
 
-    def test_valid_file(self, tmp_path: Path) -> None:
+    def test_valid_file(self, valid_config_path: Path) -> None:
         """Loads and parses a valid TOML file."""
-        path = tmp_path / "config.toml"
-        path.write_text('host = "localhost"\nport = 8080\n')
-        result = SampleConfig.load(path)
+        result = SampleConfig.load(valid_config_path)
         assert result.is_ok()
         config = result.unwrap()
         assert config.host == "localhost"
@@ -83,11 +89,9 @@ class TestLoad:
 class TestLoadOrExit:
     """Tests for TomlConfig.load_or_exit class method."""
 
-    def test_valid_file(self, tmp_path: Path) -> None:
+    def test_valid_file(self, valid_config_path: Path) -> None:
         """Returns config instance for valid file."""
-        path = tmp_path / "config.toml"
-        path.write_text('host = "localhost"\nport = 8080\n')
-        config = SampleConfig.load_or_exit(path)
+        config = SampleConfig.load_or_exit(valid_config_path)
         assert config.host == "localhost"
         assert config.port == 8080
 
@@ -1,11 +1,12 @@
 """Tests for TyperPlus and version callback."""
 
 import json
-from typing import NoReturn
+from typing import Annotated, NoReturn
 
 import click
 import pytest
 import typer
+from typer.core import TyperGroup
 from typer.testing import CliRunner
 
 import mm_clikit
@@ -16,7 +17,7 @@ runner = CliRunner()
 
 @pytest.fixture(scope="module")
 def app() -> typer.Typer:
-    """App with three commands: single-alias, multi-alias, no-alias."""
+    """App with single-alias, multi-alias, and no-alias commands, plus one hidden command."""
     _app = mm_clikit.TyperPlus()
 
     @_app.command("deploy", aliases=["d"])
@@ -34,9 +35,117 @@ def app() -> typer.Typer:
         """Show info."""
         typer.echo("info-ok")
 
+    @_app.command("secret", hidden=True)
+    def secret() -> None:
+        """Secret command."""
+        typer.echo("secret")
+
+    return _app
+
+
+@pytest.fixture(scope="module")
+def app_group(app: typer.Typer) -> AliasGroup:
+    """Click group compiled once from ``app`` for tests that inspect it directly."""
+    group = typer.main.get_command(app)
+    assert isinstance(group, AliasGroup)
+    return group
+
+
+@pytest.fixture(scope="module")
+def format_commands_output(app_group: AliasGroup) -> str:
+    """Non-Rich ``format_commands`` listing of ``app``, rendered once."""
+    formatter = click.HelpFormatter()
+    app_group.format_commands(click.Context(app_group), formatter)
+    return formatter.getvalue()
+
+
+@pytest.fixture(scope="module")
+def help_output(app: typer.Typer) -> str:
+    """``--help`` output of ``app``, rendered once for the read-only help assertions."""
+    result = runner.invoke(app, ["--help"])
+    assert result.exit_code == 0
+    return result.output
+
+
+@pytest.fixture(scope="module")
+def versioned_app() -> typer.Typer:
+    """App with package_name and a single no-op command, shared by the read-only flag tests."""
+    _app = mm_clikit.TyperPlus(package_name="mm-clikit")
+
+    @_app.command("noop")
+    def noop() -> None:
+        """No-op."""
+
+    return _app
+
+
+@pytest.fixture(scope="module")
+def group_app() -> typer.Typer:
+    """App with sub-apps registered using single, multiple, and command-combined group aliases."""
+    _app = mm_clikit.TyperPlus()
+
+    public = mm_clikit.TyperPlus()
+
+    @public.command("run")
+    def run_cmd() -> None:
+        """Run something."""
+        typer.echo("sub-run")
+
+    _app.add_typer(public, name="public", aliases=["p"])
+
+    network = mm_clikit.TyperPlus()
+
+    @network.command("ping")
+    def ping_cmd() -> None:
+        """Ping."""
+        typer.echo("pong")
+
+    _app.add_typer(network, name="network", aliases=["net", "n"])
+
+    service = mm_clikit.TyperPlus()
+
+    @service.command("deploy", aliases=["d"])
+    def deploy_cmd() -> None:
+        """Deploy."""
+        typer.echo("deployed")
+
+    _app.add_typer(service, name="service", aliases=["svc"])
+
+    @_app.command("top")
+    def top_cmd() -> None:
+        """Top-level command."""
+        typer.echo("top-ok")
+
+    return _app
+
+
+def _build_meta_app(*, hide_meta_options: bool) -> typer.Typer:
+    """Build a two-command app with package_name for the meta-option help tests."""
+    _app = mm_clikit.TyperPlus(package_name="mm-clikit", hide_meta_options=hide_meta_options)
+
+    @_app.command("noop")
+    def noop() -> None:
+        """No-op."""
+
+    @_app.command("other")
+    def other() -> None:
+        """Other."""
+
     return _app
 
 
+@pytest.fixture(scope="module")
+def meta_app() -> typer.Typer:
+    """Multi-command app with package_name (hide_meta_options=True by default)."""
+    return _build_meta_app(hide_meta_options=True)
+
+
+@pytest.fixture(scope="module")
+def unhidden_meta_app() -> typer.Typer:
+    """Multi-command app with package_name and hide_meta_options=False."""
+    return _build_meta_app(hide_meta_options=False)
+
+
 class TestCreateVersionCallback:
     """Tests for create_version_callback factory."""
 
@@ -58,6 +167,13 @@ class TestCreateVersionCallback:
         output = capsys.readouterr().out
         assert "mm-clikit:" in output
 
+    def test_explicit_version(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Prints an explicitly passed version without a metadata lookup."""
+        callback = create_version_callback("not-installed-pkg", "1.2.3")
+        with pytest.raises(click.exceptions.Exit):
+            callback(True)
+        assert capsys.readouterr().out == "not-installed-pkg: 1.2.3\n"
+
     def test_callback_works_with_typer_option(self) -> None:
         """Can be used as a Typer Option callback."""
         callback = create_version_callback("mm-clikit")
@@ -67,41 +183,30 @@ class TestCreateVersionCallback:
 class TestCommandAliases:
     """Tests for command alias resolution via CliRunner."""
 
-    def test_canonical_name(self, app: typer.Typer) -> None:
-        """Canonical command name works."""
-        result = runner.invoke(app, ["deploy"])
-        assert result.exit_code == 0
-        assert "deployed" in result.output
-
-    def test_single_alias(self, app: typer.Typer) -> None:
-        """Single alias resolves to canonical command."""
-        result = runner.invoke(app, ["d"])
-        assert result.exit_code == 0
-        assert "deployed" in result.output
-
-    @pytest.mark.parametrize("alias", ["st", "s"])
-    def test_multi_alias(self, app: typer.Typer, alias: str) -> None:
-        """Each alias of a multi-alias command resolves correctly."""
-        result = runner.invoke(app, [alias])
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            ("deploy", "deployed"),  # canonical name
+            ("d", "deployed"),  # single alias
+            ("st", "status-ok"),  # each alias of a multi-alias command
+            ("s", "status-ok"),
+            ("info", "info-ok"),  # command without aliases
+        ],
+    )
+    def test_resolves(self, app: typer.Typer, name: str, expected: str) -> None:
+        """Canonical names and aliases all run the right command."""
+        result = runner.invoke(app, [name])
         assert result.exit_code == 0
-        assert "status-ok" in result.output
-
-    def test_no_alias_command(self, app: typer.Typer) -> None:
-        """Command without aliases works normally."""
-        result = runner.invoke(app, ["info"])
-        assert result.exit_code == 0
-        assert "info-ok" in result.output
+        assert expected in result.output
 
     def test_unknown_command(self, app: typer.Typer) -> None:
         """Unknown command fails gracefully."""
         result = runner.invoke(app, ["nonexistent"])
         assert result.exit_code != 0
 
-    def test_list_commands_excludes_aliases(self, app: typer.Typer) -> None:
+    def test_list_commands_excludes_aliases(self, app_group: AliasGroup) -> None:
         """list_commands returns only canonical names."""
-        group: AliasGroup = typer.main.get_command(app)  # type: ignore[assignment]
-        ctx = click.Context(group)
-        names = group.list_commands(ctx)
+        names = app_group.list_commands(click.Context(app_group))
         assert "deploy" in names
         assert "status" in names
         assert "info" in names
@@ -109,113 +214,92 @@ class TestCommandAliases:
         assert "st" not in names
         assert "s" not in names
 
+    def test_list_commands_sees_added_command(self) -> None:
+        """Commands added after construction show up in list_commands."""
+        app = mm_clikit.TyperPlus()
+
+        @app.command("one")
+        def one() -> None:
+            """First."""
+
+        @app.command("two", aliases=["t"])
+        def two() -> None:
+            """Second."""
+
+        group: AliasGroup = typer.main.get_command(app)  # type: ignore[assignment]
+        ctx = click.Context(group)
+        assert group.list_commands(ctx) == ["one", "two"]
+        group.add_command(click.Command("three"))
+        assert group.list_commands(ctx) == ["one", "two", "three"]
+
 
 class TestHelpOutput:
     """Tests for alias display in help output."""
 
-    def test_aliases_shown_in_help(self, app: typer.Typer) -> None:
+    def test_aliases_shown_in_help(self, help_output: str) -> None:
         """Help output shows aliases in parentheses."""
-        result = runner.invoke(app, ["--help"])
-        assert result.exit_code == 0
-        assert "deploy (d)" in result.output
+        assert "deploy (d)" in help_output
 
-    def test_multi_aliases_shown_in_help(self, app: typer.Typer) -> None:
+    def test_multi_aliases_shown_in_help(self, help_output: str) -> None:
         """Multi-alias command shows all aliases."""
-        result = runner.invoke(app, ["--help"])
-        assert "status (st, s)" in result.output
+        assert "status (st, s)" in help_output
 
-    def test_plain_command_no_parens(self, app: typer.Typer) -> None:
+    def test_plain_command_no_parens(self, help_output: str) -> None:
         """Non-aliased command appears without parentheses."""
-        result = runner.invoke(app, ["--help"])
         # "info" must appear but not "info ("
-        assert "info" in result.output
-        assert "info (" not in result.output
+        assert "info" in help_output
+        assert "info (" not in help_output
 
-    def test_names_restored_after_help(self, app: typer.Typer) -> None:
+    def test_names_restored_after_help(self, app_group: AliasGroup) -> None:
         """Command names are restored after help rendering."""
-        group: AliasGroup = typer.main.get_command(app)  # type: ignore[assignment]
-        deploy_cmd = group.commands["deploy"]
+        deploy_cmd = app_group.commands["deploy"]
         original_name = deploy_cmd.name
 
-        # Trigger help rendering
-        runner.invoke(app, ["--help"])
+        # Render help on the same group whose commands are patched
+        app_group.get_help(click.Context(app_group))
 
         assert deploy_cmd.name == original_name
 
-    def test_format_commands_shows_aliases(self, app: typer.Typer) -> None:
+    def test_format_commands_shows_aliases(self, format_commands_output: str) -> None:
         """format_commands fallback renders aliases correctly."""
-        group: AliasGroup = typer.main.get_command(app)  # type: ignore[assignment]
-        ctx = click.Context(group)
-        formatter = click.HelpFormatter()
-        group.format_commands(ctx, formatter)
-        output = formatter.getvalue()
-        assert "deploy (d)" in output
-        assert "status (st, s)" in output
+        assert "deploy (d)" in format_commands_output
+        assert "status (st, s)" in format_commands_output
 
-    def test_format_commands_excludes_hidden(self) -> None:
+    def test_format_commands_excludes_hidden(self, format_commands_output: str) -> None:
         """Hidden commands are excluded from format_commands."""
-        hidden_app = mm_clikit.TyperPlus()
-
-        @hidden_app.command("visible")
-        def visible() -> None:
-            """Visible command."""
-            typer.echo("visible")
-
-        @hidden_app.command("secret", hidden=True)
-        def secret() -> None:
-            """Secret command."""
-            typer.echo("secret")
-
-        group: AliasGroup = typer.main.get_command(hidden_app)  # type: ignore[assignment]
-        ctx = click.Context(group)
-        formatter = click.HelpFormatter()
-        group.format_commands(ctx, formatter)
-        output = formatter.getvalue()
-        assert "visible" in output
-        assert "secret" not in output
+        assert "info" in format_commands_output
+        assert "secret" not in format_commands_output
 
 
 class TestTyperPlusInit:
     """Tests for TyperPlus initialization."""
 
-    def test_default_cls_is_alias_group(self) -> None:
+    def test_default_cls_is_alias_group(self, app: typer.Typer) -> None:
         """Default cls is AliasGroup."""
-        app = mm_clikit.TyperPlus()
-
-        @app.command("one")
-        def one() -> None:
-            """First."""
-
-        @app.command("two")
-        def two() -> None:
-            """Second."""
-
-        group = typer.main.get_command(app)
-        assert isinstance(group, AliasGroup)
-
-    def test_version_flag(self) -> None:
-        """--version works when package_name is provided."""
-        app = mm_clikit.TyperPlus(package_name="mm-clikit")
-
-        @app.command("noop")
-        def noop() -> None:
-            """No-op."""
+        assert isinstance(typer.main.get_command(app), AliasGroup)
 
-        result = runner.invoke(app, ["--version"])
+    @pytest.mark.parametrize("flag", ["--version", "-V"])
+    def test_version_flag(self, versioned_app: typer.Typer, flag: str) -> None:
+        """--version and -V work when package_name is provided."""
+        result = runner.invoke(versioned_app, [flag])
         assert result.exit_code == 0
         assert "mm-clikit:" in result.output
 
-    def test_version_short_flag(self) -> None:
-        """-V works when package_name is provided."""
-        app = mm_clikit.TyperPlus(package_name="mm-clikit")
+    def test_explicit_version_flag(self) -> None:
+        """--version prints the version passed to TyperPlus instead of the installed one."""
+        app = mm_clikit.TyperPlus(package_name="not-installed-pkg", version="1.2.3")
 
         @app.command("noop")
         def noop() -> None:
             """No-op."""
 
-        result = runner.invoke(app, ["-V"])
+        @app.command("other")
+        def other() -> None:
+            """Other."""
+
+        result = runner.invoke(app, ["--version"])
         assert result.exit_code == 0
-        assert "mm-clikit:" in result.output
+        assert "not-installed-pkg: 1.2.3" in result.output
 
     def test_no_version_without_package_name(self) -> None:
         """--version is absent when package_name is not set."""
@@ -272,72 +356,46 @@ class TestTyperPlusInit:
 class TestCommandDecorator:
     """Tests for the command() decorator alias storage."""
 
-    def test_aliases_stored_on_callback(self) -> None:
-        """_typer_aliases is set on callback when aliases are provided."""
-        app = mm_clikit.TyperPlus()
-
-        @app.command("cmd", aliases=["c", "cm"])
-        def cmd() -> None:
-            """Command."""
-
-        assert getattr(cmd, "_typer_aliases", None) == ["c", "cm"]
-
-    def test_no_aliases_attr_without_param(self) -> None:
-        """_typer_aliases is absent when aliases param is not passed."""
+    def test_alias_storage(self) -> None:
+        """_typer_aliases holds given aliases, stays [] for aliases=[], and is absent without the param."""
         app = mm_clikit.TyperPlus()
 
-        @app.command("cmd")
-        def cmd() -> None:
-            """Command."""
-
-        assert not hasattr(cmd, "_typer_aliases")
+        @app.command("with-aliases", aliases=["c", "cm"])
+        def with_aliases() -> None:
+            """Command with aliases."""
 
-    def test_empty_aliases_list(self) -> None:
-        """Empty aliases=[] stores empty list, treated as no aliases."""
-        app = mm_clikit.TyperPlus()
+        @app.command("no-param")
+        def no_param() -> None:
+            """Command without the aliases param."""
 
-        @app.command("cmd", aliases=[])
-        def cmd() -> None:
-            """Command."""
+        @app.command("empty", aliases=[])
+        def empty() -> None:
+            """Command with an empty aliases list."""
 
-        assert getattr(cmd, "_typer_aliases", None) == []
+        assert getattr(with_aliases, "_typer_aliases", None) == ["c", "cm"]
+        assert not hasattr(no_param, "_typer_aliases")
+        assert getattr(empty, "_typer_aliases", None) == []
 
 
 class TestGroupAliases:
     """Tests for group-level aliases via add_typer(aliases=[...])."""
 
-    @pytest.fixture()
-    def group_app(self) -> typer.Typer:
-        """App with a sub-app registered using group aliases."""
-        app = mm_clikit.TyperPlus()
-
-        sub = mm_clikit.TyperPlus()
-
-        @sub.command("run")
-        def run_cmd() -> None:
-            """Run something."""
-            typer.echo("sub-run")
-
-        app.add_typer(sub, name="public", aliases=["p"])
-
-        @app.command("top")
-        def top_cmd() -> None:
-            """Top-level command."""
-            typer.echo("top-ok")
-
-        return app
-
-    def test_canonical_name(self, group_app: typer.Typer) -> None:
-        """Canonical group name resolves correctly."""
-        result = runner.invoke(group_app, ["public", "run"])
+    @pytest.mark.parametrize(
+        ("args", "expected"),
+        [
+            (["public", "run"], "sub-run"),  # canonical group name
+            (["p", "run"], "sub-run"),  # single group alias
+            (["network", "ping"], "pong"),  # each alias of a multi-alias group
+            (["net", "ping"], "pong"),
+            (["n", "ping"], "pong"),
+            (["svc", "d"], "deployed"),  # group alias combined with a command alias
+        ],
+    )
+    def test_resolves(self, group_app: typer.Typer, args: list[str], expected: str) -> None:
+        """Canonical group names and group aliases all resolve."""
+        result = runner.invoke(group_app, args)
         assert result.exit_code == 0
-        assert "sub-run" in result.output
-
-    def test_alias_resolves(self, group_app: typer.Typer) -> None:
-        """Alias resolves to canonical group."""
-        result = runner.invoke(group_app, ["p", "run"])
-        assert result.exit_code == 0
-        assert "sub-run" in result.output
+        assert expected in result.output
 
     def test_help_shows_alias(self, group_app: typer.Typer) -> None:
         """Help output shows alias in parentheses."""
@@ -353,46 +411,31 @@ class TestGroupAliases:
         assert "public" in names
         assert "p" not in names
 
-    def test_multi_alias(self) -> None:
-        """Multiple group aliases all resolve."""
+    def test_alias_without_name_raises(self) -> None:
+        """Passing aliases without name raises ValueError."""
         app = mm_clikit.TyperPlus()
         sub = mm_clikit.TyperPlus()
 
-        @sub.command("ping")
-        def ping_cmd() -> None:
-            """Ping."""
-            typer.echo("pong")
-
-        app.add_typer(sub, name="network", aliases=["net", "n"])
-
-        for alias in ["network", "net", "n"]:
-            result = runner.invoke(app, [alias, "ping"])
-            assert result.exit_code == 0, f"Failed for {alias}"
-            assert "pong" in result.output
+        with pytest.raises(ValueError, match="Cannot set aliases without a name"):
+            app.add_typer(sub, aliases=["x"])
 
-    def test_combined_with_command_aliases(self) -> None:
-        """Group aliases and command aliases work together."""
-        app = mm_clikit.TyperPlus()
+    def test_aliases_isolated_between_apps(self, group_app: typer.Typer) -> None:
+        """Group aliases of one app do not leak into another app built with the same options."""
+        other = mm_clikit.TyperPlus()
         sub = mm_clikit.TyperPlus()
 
-        @sub.command("deploy", aliases=["d"])
-        def deploy_cmd() -> None:
-            """Deploy."""
-            typer.echo("deployed")
-
-        app.add_typer(sub, name="service", aliases=["svc"])
+        @sub.command("run")
+        def run_cmd() -> None:
+            """Run something."""
 
-        result = runner.invoke(app, ["svc", "d"])
-        assert result.exit_code == 0
-        assert "deployed" in result.output
+        other.add_typer(sub, name="public")
 
-    def test_alias_without_name_raises(self) -> None:
-        """Passing aliases without name raises ValueError."""
-        app = mm_clikit.TyperPlus()
-        sub = mm_clikit.TyperPlus()
+        @other.command("top")
+        def top_cmd() -> None:
+            """Top-level command."""
 
-        with pytest.raises(ValueError, match="Cannot set aliases without a name"):
-            app.add_typer(sub, aliases=["x"])
+        assert runner.invoke(group_app, ["p", "run"]).exit_code == 0
+        assert runner.invoke(other, ["p", "run"]).exit_code != 0
 
     def test_isinstance_alias_group(self, group_app: typer.Typer) -> None:
         """Bound subclass is still isinstance of AliasGroup."""
@@ -427,15 +470,10 @@ class TestSingleCommandMode:
         assert result.exit_code == 0
         assert "host=myhost" in result.output
 
-    def test_version_flag(self, single_app: typer.Typer) -> None:
-        """--version works in single-command mode."""
-        result = runner.invoke(single_app, ["--version"])
-        assert result.exit_code == 0
-        assert "mm-clikit:" in result.output
-
-    def test_version_short_flag(self, single_app: typer.Typer) -> None:
-        """-V works in single-command mode."""
-        result = runner.invoke(single_app, ["-V"])
+    @pytest.mark.parametrize("flag", ["--version", "-V"])
+    def test_version_flag(self, single_app: typer.Typer, flag: str) -> None:
+        """--version and -V work in single-command mode."""
+        result = runner.invoke(single_app, [flag])
         assert result.exit_code == 0
         assert "mm-clikit:" in result.output
 
@@ -446,6 +484,14 @@ class TestSingleCommandMode:
         assert "Manage host entries" in result.output
         assert "Default callback" not in result.output
 
+    def test_setup_runs_once(self, single_app: mm_clikit.TyperPlus, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Repeated registered_callback reads run the single-command setup only once."""
+        calls: list[object] = []
+        monkeypatch.setattr(single_app, "_propagate_no_args_is_help", calls.append)
+        _ = single_app.registered_callback
+        _ = single_app.registered_callback
+        assert len(calls) == 1
+
     def test_no_args_is_help_propagated(self, single_app: typer.Typer) -> None:
         """Running without arguments shows full help, not just a bare error."""
         result = runner.invoke(single_app, [])
@@ -512,12 +558,14 @@ class TestSingleCommandMode:
         assert "mm-clikit:" in result.output
 
 
-class TestHideMetaOptions:
-    """Tests for hide_meta_options feature."""
+class TestVersionFastPath:
+    """Tests for the bare ``--version`` shortcut in ``TyperPlus.__call__``."""
 
-    @pytest.fixture()
-    def meta_app(self) -> typer.Typer:
-        """Multi-command app with package_name (hide_meta_options=True by default)."""
+    @pytest.mark.parametrize("flag", ["--version", "-V"])
+    def test_prints_version_without_click(
+        self, flag: str, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """A bare version flag is answered before the Click command is built."""
         app = mm_clikit.TyperPlus(package_name="mm-clikit")
 
         @app.command("noop")
@@ -528,7 +576,115 @@ class TestHideMetaOptions:
         def other() -> None:
             """Other."""
 
-        return app
+        def fail(*_args: object) -> NoReturn:
+            raise AssertionError("Click command should not be built")
+
+        monkeypatch.setattr(typer.main, "get_command", fail)
+        monkeypatch.setattr("sys.argv", ["prog", flag])
+        with pytest.raises(SystemExit) as exc_info:
+            app()
+        assert exc_info.value.code == 0
+        assert capsys.readouterr().out.startswith("mm-clikit: ")
+
+    def test_user_defined_version_is_respected(self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+        """A user-declared --version option bypasses the shortcut."""
+        app = mm_clikit.TyperPlus(package_name="mm-clikit")
+
+        def custom_version_callback(value: bool) -> None:
+            if value:
+                typer.echo("custom-version-output")
+                raise typer.Exit
+
+        @app.callback()
+        def main(
+            _version: bool | None = typer.Option(None, "--version", "-V", callback=custom_version_callback, is_eager=True),
+        ) -> None:
+            """CLI with user-defined _version."""
+
+        @app.command("noop")
+        def noop() -> None:
+            """No-op."""
+
+        monkeypatch.setattr("sys.argv", ["prog", "--version"])
+        with pytest.raises(SystemExit):
+            app()
+        output = capsys.readouterr().out
+        assert "custom-version-output" in output
+        assert "mm-clikit:" not in output
+
+    @pytest.mark.parametrize("annotated", [False, True], ids=["plain", "annotated"])
+    def test_implicit_version_parameter_is_respected(
+        self, annotated: bool, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """A parameter named ``version`` becomes Typer's own --version and bypasses the shortcut."""
+        app = mm_clikit.TyperPlus(package_name="mm-clikit")
+
+        if annotated:
+
+            @app.command("show")
+            def show(version: Annotated[bool, typer.Option(help="Show the user version.")] = False) -> None:
+                """Echo the version flag."""
+                typer.echo(f"user-version={version}")
+
+        else:
+
+            @app.command("show")
+            def show(version: bool = False) -> None:
+                """Echo the version flag."""
+                typer.echo(f"user-version={version}")
+
+        monkeypatch.setattr("sys.argv", ["prog", "--version"])
+        with pytest.raises(SystemExit):
+            app()
+        output = capsys.readouterr().out
+        assert "user-version=True" in output
+        assert "mm-clikit:" not in output
+
+    def test_implicit_version_in_group_callback_is_respected(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """A group callback parameter named ``version`` bypasses the shortcut."""
+        app = mm_clikit.TyperPlus(package_name="mm-clikit")
+
+        @app.callback(invoke_without_command=True)
+        def main(version: bool = False) -> None:
+            """CLI with an implicit --version."""
+            typer.echo(f"user-version={version}")
+
+        @app.command("noop")
+        def noop() -> None:
+            """No-op."""
+
+        monkeypatch.setattr("sys.argv", ["prog", "--version"])
+        with pytest.raises(SystemExit):
+            app()
+        output = capsys.readouterr().out
+        assert "user-version=True" in output
+        assert "mm-clikit:" not in output
+
+    def test_custom_cls_skips_shortcut(self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+        """A custom group class gets no --version, so the shortcut must not answer it either."""
+        app = mm_clikit.TyperPlus(package_name="mm-clikit", cls=TyperGroup)
+
+        @app.command("noop")
+        def noop() -> None:
+            """No-op."""
+
+        @app.command("other")
+        def other() -> None:
+            """Other."""
+
+        monkeypatch.setattr("sys.argv", ["prog", "--version"])
+        with pytest.raises(SystemExit) as exc_info:
+            app()
+        assert exc_info.value.code == 2
+        captured = capsys.readouterr()
+        assert "No such option" in captured.err
+        assert "mm-clikit:" not in captured.out
+
+
+class TestHideMetaOptions:
+    """Tests for hide_meta_options feature."""
 
     def test_normal_help_hides_meta_options(self, meta_app: typer.Typer) -> None:
         """Normal --help hides --version, --install-completion, --show-completion."""
@@ -538,6 +694,17 @@ class TestHideMetaOptions:
         assert "--install-completion" not in result.output
         assert "--show-completion" not in result.output
 
+    def test_meta_options_visible_after_help(self, meta_app: typer.Typer) -> None:
+        """Meta options hidden for a help render are visible again afterwards."""
+        group: AliasGroup = typer.main.get_command(meta_app)  # type: ignore[assignment]
+        ctx = click.Context(group)
+        group.get_help(ctx)
+        version_opt = next(p for p in group.params if "--version" in p.opts)
+        help_opt = group.get_help_option(ctx)
+        assert help_opt is not None
+        assert not version_opt.hidden
+        assert not help_opt.hidden
+
     def test_help_all_shows_all_options(self, meta_app: typer.Typer) -> None:
         """--help-all shows all options including hidden meta ones."""
         result = runner.invoke(meta_app, ["--help-all"])
@@ -547,36 +714,16 @@ class TestHideMetaOptions:
         assert "--show-completion" in result.output
         assert "--help" in result.output
 
-    def test_disabled_shows_all_in_normal_help(self) -> None:
+    def test_disabled_shows_all_in_normal_help(self, unhidden_meta_app: typer.Typer) -> None:
         """hide_meta_options=False keeps all options visible in normal --help."""
-        app = mm_clikit.TyperPlus(package_name="mm-clikit", hide_meta_options=False)
-
-        @app.command("noop")
-        def noop() -> None:
-            """No-op."""
-
-        @app.command("other")
-        def other() -> None:
-            """Other."""
-
-        result = runner.invoke(app, ["--help"])
+        result = runner.invoke(unhidden_meta_app, ["--help"])
         assert result.exit_code == 0
         assert "--version" in result.output
         assert "--install-completion" in result.output
 
-    def test_disabled_no_help_all_flag(self) -> None:
+    def test_disabled_no_help_all_flag(self, unhidden_meta_app: typer.Typer) -> None:
         """hide_meta_options=False does not add --help-all."""
-        app = mm_clikit.TyperPlus(hide_meta_options=False)
-
-        @app.command("noop")
-        def noop() -> None:
-            """No-op."""
-
-        @app.command("other")
-        def other() -> None:
-            """Other."""
-
-        result = runner.invoke(app, ["--help-all"])
+        result = runner.invoke(unhidden_meta_app, ["--help-all"])
         assert result.exit_code != 0
 
 